@@ -4,6 +4,7 @@ Example usage of the LogAnalyzer module - Basic functionality
 
 from log_analyzer_module import LogAnalyzer, LogAnalyzerConfig
 from log_analyzer_module.config import Configurations
+from log_analyzer_module.reporting import configure_logging, emit_report
 
 def basic_example():
     """Basic usage example"""
@@ -79,27 +80,30 @@ def analysis_only_example():
     results = analyzer.run_analysis(generate_summary=False)
     
     if results:
-        print("Manual analysis of results:")
+        lines = ["Manual analysis of results:"]
         startup_count = len(results['startup_events'])
         stop_count = len(results['stop_events'])
         
-        print(f"System restarts detected: {min(startup_count, stop_count)}")
+        lines.append(f"System restarts detected: {min(startup_count, stop_count)}")
         
         if startup_count > stop_count:
-            print(f"Warning: {startup_count - stop_count} unmatched startup(s)")
+            lines.append(f"Warning: {startup_count - stop_count} unmatched startup(s)")
         elif stop_count > startup_count:
-            print(f"Warning: {stop_count - startup_count} unmatched shutdown(s)")
+            lines.append(f"Warning: {stop_count - startup_count} unmatched shutdown(s)")
             
         # Show most common errors
         if results['message_counts']:
             most_common = results['message_counts'].most_common(3)
-            print("Top error patterns:")
+            lines.append("Top error patterns:")
             for error, count in most_common:
-                print(f"  {error}: {count} occurrences")
+                lines.append(f"  {error}: {count} occurrences")
+        
+        emit_report(lines)
     
     return results
 
 if __name__ == "__main__":
+    configure_logging()
     try:
         # Run all examples
         basic_example()
@@ -5,6 +5,7 @@ Example of continuous monitoring with the LogAnalyzer module
 import time
 import threading
 from log_analyzer_module import LogAnalyzer
+from log_analyzer_module.reporting import configure_logging
 
 def continuous_monitoring_example():
     """Example of continuous monitoring"""
@@ -48,15 +49,16 @@ def simulate_log_updates():
         "INFO System shutdown initiated"
     ]
     
-    for i, entry in enumerate(test_entries):
-        timestamp = datetime.now().strftime('%d-%m-%Y %H:%M:%S')
-        log_line = f"{timestamp} {entry}\n"
-        
-        with open(log_file, 'a') as f:
+    # Open once; line buffering still hands each entry to the monitor immediately
+    with open(log_file, 'a', buffering=1) as f:
+        for i, entry in enumerate(test_entries):
+            timestamp = datetime.now().strftime('%d-%m-%Y %H:%M:%S')
+            log_line = f"{timestamp} {entry}\n"
+            
             f.write(log_line)
-        
-        print(f"Added: {log_line.strip()}")
-        time.sleep(5)  # Wait 5 seconds between entries
+            
+            print(f"Added: {log_line.strip()}")
+            time.sleep(5)  # Wait 5 seconds between entries
     
     print("✅ Finished adding test entries")
 
@@ -95,6 +97,8 @@ def monitoring_with_custom_interval():
 if __name__ == "__main__":
     import sys
     
+    configure_logging()
+    
     if len(sys.argv) > 1:
         if sys.argv[1] == "simulate":
             simulate_log_updates()
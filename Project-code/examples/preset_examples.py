@@ -4,6 +4,7 @@ Example showing different configuration presets
 
 from log_analyzer_module import LogAnalyzer
 from log_analyzer_module.config import Configurations
+from log_analyzer_module.reporting import configure_logging, emit_report
 
 def web_server_analysis():
     """Analyze web server logs"""
@@ -124,21 +125,26 @@ def compare_configurations():
             }
     
     # Print comparison
-    print("\n" + "="*60)
-    print("CONFIGURATION COMPARISON RESULTS")
-    print("="*60)
+    lines = [
+        "\n" + "="*60,
+        "CONFIGURATION COMPARISON RESULTS",
+        "="*60
+    ]
     
     for name, data in results.items():
-        print(f"\n{name}:")
-        print(f"  Startup Events: {data['startup_events']}")
-        print(f"  Stop Events: {data['stop_events']}")
-        print(f"  Total Issues: {data['total_issues']}")
+        lines.append(f"\n{name}:")
+        lines.append(f"  Startup Events: {data['startup_events']}")
+        lines.append(f"  Stop Events: {data['stop_events']}")
+        lines.append(f"  Total Issues: {data['total_issues']}")
         if data['message_counts']:
-            print(f"  Top Issues: {dict(list(data['message_counts'].items())[:3])}")
+            lines.append(f"  Top Issues: {dict(list(data['message_counts'].items())[:3])}")
         else:
-            print(f"  Top Issues: None detected")
+            lines.append(f"  Top Issues: None detected")
+    
+    emit_report(lines)
 
 if __name__ == "__main__":
+    configure_logging()
     try:
         # Run individual analyses
         web_server_analysis()
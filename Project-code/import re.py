@@ -1,19 +1,195 @@
 import os
+import sys
+import mmap
+import hashlib
+import pickle
 import re
-import glob
+import heapq
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from datetime import datetime   
 import ollama
+from log_analyzer_module.llm_cache import ResponseCache, cached_call
+"Matchers, readahead and the prompt's timestamp list come from the package next to this script"
+from log_analyzer_module.helpers import (ahocorasick, build_automaton, build_table, numba, prefetch,
+                                         summarize_timestamps)
+if numba is not None:
+    from log_analyzer_module.helpers import count_lines_with_terms, np
+
+"Prebuilt search matchers keyed by configuration, so re-runs skip that work"
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "log_analyzer")
+
+"Finished LLM answers come from the package's bounded response cache, shared with LogAnalyzer"
+_generate = cached_call(ResponseCache())(ollama.generate)
+
+"Bumped whenever the pickled matchers change shape, so stale cache files are never loaded"
+MATCHER_CACHE_VERSION = 3
+
+
+def _load_matchers(search_list):
+    """(table, automaton) for the search terms, unpickled from the cache when these terms were built before"""
+    "Which backends are installed is part of the key, since it decides what gets built"
+    key = hashlib.sha256(repr((MATCHER_CACHE_VERSION, tuple(search_list), numba is not None,
+                               ahocorasick is not None)).encode('utf-8')).hexdigest()
+    cache_path = os.path.join(CACHE_DIR, key + ".pkl")
+    try:
+        with open(cache_path, 'rb') as cached:
+            table, automaton = pickle.load(cached)
+        return table, automaton
+    except (OSError, pickle.UnpicklingError, EOFError, ValueError, TypeError, AttributeError, ImportError):
+        "A damaged or foreign cache file is rebuilt and overwritten"
+        pass
+
+    table = build_table(search_list)
+    automaton = build_automaton(search_list) if table is None else None
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(cache_path + ".tmp", 'wb') as cached:
+            pickle.dump((table, automaton), cached, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(cache_path + ".tmp", cache_path)
+    except OSError:
+        "A read-only home only costs the rebuild next time"
+        pass
+    return table, automaton
+
+
+def _extract_timestamp(line, time_pattern):
+    """Timestamp of a matched line; the usual DD-MM-YYYY HH:MM:SS at column 0 is checked by hand before any regex"""
+    if (len(line) >= 19 and line[2] == 45 and line[5] == 45 and line[10] == 32 and line[13] == 58 and line[16] == 58
+            and line[0:2].isdigit() and line[3:5].isdigit() and line[6:10].isdigit()
+            and line[11:13].isdigit() and line[14:16].isdigit() and line[17:19].isdigit()):
+        return line[:19].decode('ascii')
+    time_match = time_pattern.search(line)
+    return time_match.group(0).decode('ascii') if time_match else "Unknown Time"
+
+
+def _scan_file(log_file, needles, time_pattern, startup_b, stop_b, search_items, automaton=None, table=None):
+    """Scan one log file; kept at module level so worker processes can pickle it"""
+    startup_events = []
+    stop_events = []
+    "Plain dict in the hot loop, turned into a Counter once at the end"
+    counts = {msg: 0 for msg, _ in search_items}
+
+    with open(log_file,'rb') as file:
+        "mmap cannot map an empty file"
+        if os.fstat(file.fileno()).st_size == 0:
+            return startup_events, stop_events, Counter()
+        "The file is read once front to back: ask for aggressive readahead (no-ops where unsupported)"
+        if hasattr(os, 'posix_fadvise'):
+            os.posix_fadvise(file.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            if hasattr(mmap, 'MADV_SEQUENTIAL'):
+                data.madvise(mmap.MADV_SEQUENTIAL)
+            if hasattr(mmap, 'MADV_WILLNEED'):
+                data.madvise(mmap.MADV_WILLNEED)
+
+            "With the numba kernel the terms are counted over the raw bytes and the gate only hunts events"
+            if table is not None:
+                goto, out_start, out_ids, terms, weights = table
+                term_counts = count_lines_with_terms(np.frombuffer(data, dtype=np.uint8), goto, out_start, out_ids, len(terms))
+                for msg, weight, count in zip(terms, weights, term_counts):
+                    counts[msg] += weight * int(count)
+
+            "Everything the loop touches per hit is bound to a local name up front"
+            find = data.find
+            rfind = data.rfind
+            startup_append = startup_events.append
+            stop_append = stop_events.append
+            file_name = os.path.basename(log_file)
+            count_terms = table is None
+            size = len(data)
+
+            "An empty needle is in every line, so it walks the lines instead of sitting in the heap"
+            every_line = not all(needles)
+            needles = [needle for needle in needles if needle]
+
+            "bytes.find per needle (a memchr-speed scan) gates the lines; a heap yields the nearest hit next"
+            hits = [(find(needle), i) for i, needle in enumerate(needles)]
+            hits = [hit for hit in hits if hit[0] != -1]
+            heapq.heapify(hits)
+            pos = 0
+            while pos < size:
+                if every_line:
+                    hit = pos
+                elif hits:
+                    hit = hits[0][0]
+                else:
+                    break
+                start = rfind(b'\n', 0, hit) + 1
+                end = find(b'\n', hit)
+                if end == -1:
+                    end = size
+                pos = end + 1
+                line = data[start:end]
+
+                "Move every needle that hit this line past it"
+                while hits and hits[0][0] < pos:
+                    _, i = hits[0]
+                    nxt = find(needles[i], pos)
+                    if nxt == -1:
+                        heapq.heappop(hits)
+                    else:
+                        heapq.heapreplace(hits, (nxt, i))
+
+                "Check for startup/stop events; the timestamp is only looked up and decoded for those lines"
+                is_startup = startup_b in line
+                is_stop = stop_b in line
+                if is_startup or is_stop:
+                    timestamp = _extract_timestamp(line, time_pattern)
+                    text = line.decode('utf-8', errors='replace').strip()
+
+                    if is_startup:
+                        startup_append({"timestamp": timestamp, "file": file_name, "line": text})
+
+                    if is_stop:
+                        stop_append({"timestamp": timestamp, "file": file_name, "line": text})
+
+                "Count keys stay the original strings so the summary prints them unchanged"
+                if automaton is not None:
+                    for ids in {value for _, value in automaton.iter(line.decode('utf-8', errors='replace'))}:
+                        for idx in ids:
+                            counts[search_items[idx][0]] += 1
+                elif count_terms:
+                    for msg, msg_b in search_items:
+                        if msg_b in line:
+                            counts[msg] += 1
+
+        "A one-off scan should not push other workloads' pages out of the cache"
+        if hasattr(os, 'posix_fadvise'):
+            os.posix_fadvise(file.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+    return startup_events, stop_events, Counter({msg: n for msg, n in counts.items() if n})
 
 
 class LogAnalyzer:
-    def __init__(self, directory_path,startup_msg,stop_msg , search_list):
+    def __init__(self, directory_path,startup_msg,stop_msg , search_list, prefetch=True):
         self.directory_path = directory_path
+        self.prefetch = prefetch and hasattr(os, 'posix_fadvise')
         self.startup_msg = startup_msg
         self.stop_msg = stop_msg
         self.search_list = search_list
         self.time_pattern = re.compile(r'(\d{2}-\d{2}-\d{4} \d{2}:\d{2}:\d{2})')
+        "Encoded once here so the scan compares bytes against bytes"
+        self._startup_b = startup_msg.encode('utf-8')
+        self._stop_b = stop_msg.encode('utf-8')
+        self._search_items = tuple((msg, msg.encode('utf-8')) for msg in search_list)
+        self._time_pattern_b = re.compile(rb'(\d{2}-\d{2}-\d{4} \d{2}:\d{2}:\d{2})')
+        "Building the matchers costs more than loading them, so they are kept on disk per term list"
+        self._table, self._automaton = _load_matchers(search_list)
+        "Every message a line can be interesting for; the numba kernel counts the terms on its own"
+        self._needles = (self._startup_b, self._stop_b)
+        if self._table is None:
+            self._needles += tuple(msg_b for _, msg_b in self._search_items)
     
+    def _iter_log_files(self):
+        """Yield (path, size) of every .log file; scandir hands back the stat info with the listing"""
+        if not os.path.isdir(self.directory_path):
+            return
+        with os.scandir(self.directory_path) as entries:
+            for entry in entries:
+                if entry.name.endswith('.log') and not entry.name.startswith('.') and entry.is_file():
+                    yield entry.path, entry.stat().st_size
+
     def parse_logs(self):
         """Read all the logs and create a dict out of it for processing"""
         stats={
@@ -23,30 +199,35 @@ class LogAnalyzer:
             }
         
         "Get all log files in the directory"
-        log_files = glob.glob(f"{self.directory_path}/*.log")
+        log_files = list(self._iter_log_files())
 
         if not log_files:
             print("No log files found in the specified directory.")
             return None
         
         print(f"No. of files have to scan {len(log_files)}")
+
+        "Largest first so the big files start early and keep the workers balanced; empty files have nothing to scan"
+        log_files = [(path, size) for path, size in sorted(log_files, key=lambda f: f[1], reverse=True) if size]
+        if self.prefetch:
+            prefetch(log_files)
+        log_files = [path for path, _ in log_files]
         
-        for log_file in log_files:
-            with open(log_file,'r',encoding='utf-8') as file:
-                for line in file:
-                    time_match = self.time_pattern.search(line)
-                    timestamp = time_match.group(0) if time_match else "Unknown Time"
-
-                    "Check for startup events"
-                    if self.startup_msg in line:
-                        stats["startup_events"].append({"timestamp": timestamp, "file":os.path.basename(log_file), "line": line.strip()})
-                    
-                    if self.stop_msg in line:
-                        stats["stop_events"].append({"timestamp": timestamp, "file":os.path.basename(log_file), "line": line.strip()})
-                    
-                    for msg in self.search_list:
-                        if msg in line:
-                            stats["message_counts"][msg] += 1
+        scan = partial(_scan_file, needles=self._needles, time_pattern=self._time_pattern_b,
+                       startup_b=self._startup_b, stop_b=self._stop_b, search_items=self._search_items,
+                       automaton=self._automaton, table=self._table)
+
+        "Files are independent, so scan them in parallel; a single file is not worth the fork"
+        if len(log_files) <= 1:
+            results = [scan(log_file) for log_file in log_files]
+        else:
+            with ProcessPoolExecutor(max_workers=min(len(log_files), os.cpu_count() or 1)) as executor:
+                results = list(executor.map(scan, log_files, chunksize=4))
+
+        for startup_events, stop_events, message_counts in results:
+            stats["startup_events"].extend(startup_events)
+            stats["stop_events"].extend(stop_events)
+            stats["message_counts"].update(message_counts)
         return stats
     
     def generate_ai_summary(self, stats):
@@ -59,10 +240,10 @@ class LogAnalyzer:
         Here is the technical analysis of the application logs:
         
         1. Startup Events Detected: {len(stats['startup_events'])}
-           Timestamps: {[e['timestamp'] for e in stats['startup_events']]}
+           Timestamps: [{summarize_timestamps(stats['startup_events'])}]
         
         2. Shutdown Events Detected: {len(stats['stop_events'])}
-           Timestamps: {[e['timestamp'] for e in stats['stop_events']]}
+           Timestamps: [{summarize_timestamps(stats['stop_events'])}]
            
         3. Critical Message Counts:
            {dict(stats['message_counts'])}
@@ -74,12 +255,17 @@ class LogAnalyzer:
 
         print("\n--- Sending data to Local LLM (Llama2) ---")
         try:
-            response = ollama.generate(
+            "Stream the answer so the first words show up as soon as the model produces them"
+            stream = _generate(
                 model='llama2',
-                prompt=prompt_data
+                prompt=prompt_data,
+                stream=True
             )
             print("\n=== AI LOG ANALYSIS SUMMARY ===\n")
-            print(response['response'])
+            for chunk in stream:
+                sys.stdout.write(chunk['response'])
+                sys.stdout.flush()
+            print()
             
         except Exception as e:
             print(f"Error connecting to Local LLM: {e}")
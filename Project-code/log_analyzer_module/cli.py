@@ -1,7 +1,17 @@
 import argparse
+import logging
 import sys
 from .log_analyzer import LogAnalyzer
 from .config import LogAnalyzerConfig, Configurations
+from .reporting import configure_logging
+
+# Preset name -> factory, resolved once at import
+_PRESET_MAP = {
+    'web': Configurations.web_server_config,
+    'database': Configurations.database_config,
+    'application': Configurations.application_config,
+    'system': Configurations.system_config,
+}
 
 def main():
     """Command line interface for LogAnalyzer"""
@@ -56,7 +66,7 @@ Examples:
     
     parser.add_argument(
         '--preset', '-p',
-        choices=['web', 'database', 'application', 'system'],
+        choices=list(_PRESET_MAP),
         help='Use predefined configuration preset'
     )
     
@@ -73,6 +83,12 @@ Examples:
         help='Monitoring interval in seconds (default: 60)'
     )
     
+    parser.add_argument(
+        '--verbose', '-v',
+        action='store_true',
+        help='Show per-file scan details'
+    )
+    
     parser.add_argument(
         '--version',
         action='version',
@@ -80,18 +96,12 @@ Examples:
     )
     
     args = parser.parse_args()
+    configure_logging(logging.DEBUG if args.verbose else logging.INFO)
     
     try:
         # Use preset configuration if specified
         if args.preset:
-            if args.preset == 'web':
-                config = Configurations.web_server_config()
-            elif args.preset == 'database':
-                config = Configurations.database_config()
-            elif args.preset == 'application':
-                config = Configurations.application_config()
-            elif args.preset == 'system':
-                config = Configurations.system_config()
+            config = _PRESET_MAP[args.preset]()
                 
             analyzer = LogAnalyzer(
                 args.directory,
@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import List
+from typing import Optional, Sequence
 
 @dataclass
 class LogAnalyzerConfig:
@@ -13,7 +13,7 @@ class LogAnalyzerConfig:
     shutdown_message: str = "shutdown"
     
     # Search patterns
-    search_patterns: List[str] = None
+    search_patterns: Optional[Sequence[str]] = None
     
     # LLM settings
     llm_model: str = "llama2"
@@ -0,0 +1,177 @@
+"""
+Scanning and prompt helpers shared by LogAnalyzer and the standalone
+import re.py script.
+
+The optional matcher backends are imported here, so both callers build
+the same structures from the same installed packages.
+"""
+
+import os
+from collections import deque
+from typing import Dict, List, Tuple
+
+try:
+    import ahocorasick  # pyahocorasick, optional: counts every search term in one pass
+except ImportError:
+    ahocorasick = None
+
+try:
+    import numba  # optional: JIT-compiles the byte-level term counting kernel
+    import numpy as np
+except ImportError:
+    numba = None
+
+# Only the first and last this many event timestamps go into the prompt;
+# prefill cost grows with prompt length and more do not improve the summary
+PROMPT_TIMESTAMPS = 5
+
+# How much of the scan queue the kernel is asked to start reading ahead of
+# the scanners
+PREFETCH_BYTES = 256 * 1024 * 1024
+
+
+def build_automaton(search_list: List[str]):
+    """
+    Build an Aho-Corasick automaton over the search terms.
+    
+    Each term maps to the tuple of its positions in search_list, so a term
+    listed twice is counted twice like the plain substring loop.
+    
+    Args:
+        search_list (List[str]): Message patterns to count
+        
+    Returns:
+        The automaton, or None if pyahocorasick is missing or a term is empty
+    """
+    # An empty term matches every line and cannot be stored in the automaton
+    if ahocorasick is None or not search_list or not all(search_list):
+        return None
+    automaton = ahocorasick.Automaton()
+    for msg in set(search_list):
+        automaton.add_word(msg, tuple(i for i, term in enumerate(search_list) if term == msg))
+    automaton.make_automaton()
+    return automaton
+
+
+def build_table(search_list: List[str]):
+    """
+    Build dense Aho-Corasick tables over the encoded search terms.
+    
+    Args:
+        search_list (List[str]): Message patterns to count
+        
+    Returns:
+        Tuple of (transition table, output offsets, output term ids, unique
+        terms, weights), or None if numba is missing or a term is empty
+    """
+    if numba is None or not search_list or not all(search_list):
+        return None
+    terms = list(dict.fromkeys(search_list))
+    
+    # Trie of the encoded terms; -1 marks a missing edge
+    goto = [[-1] * 256]
+    outputs = [[]]
+    for idx, msg in enumerate(terms):
+        state = 0
+        for byte in msg.encode('utf-8'):
+            if goto[state][byte] == -1:
+                goto[state][byte] = len(goto)
+                goto.append([-1] * 256)
+                outputs.append([])
+            state = goto[state][byte]
+        outputs[state].append(idx)
+    
+    # Breadth-first pass turns the trie into a full transition table and
+    # folds the outputs of suffix states in
+    fail = [0] * len(goto)
+    queue = deque()
+    for byte in range(256):
+        if goto[0][byte] == -1:
+            goto[0][byte] = 0
+        else:
+            queue.append(goto[0][byte])
+    while queue:
+        state = queue.popleft()
+        outputs[state] = outputs[state] + outputs[fail[state]]
+        for byte in range(256):
+            nxt = goto[state][byte]
+            if nxt == -1:
+                goto[state][byte] = goto[fail[state]][byte]
+            else:
+                fail[nxt] = goto[fail[state]][byte]
+                queue.append(nxt)
+    
+    out_start = np.zeros(len(goto) + 1, dtype=np.int32)
+    for state, out in enumerate(outputs):
+        out_start[state + 1] = out_start[state] + len(out)
+    out_ids = np.array([idx for out in outputs for idx in out], dtype=np.int32)
+    weights = [search_list.count(msg) for msg in terms]
+    return np.array(goto, dtype=np.int32), out_start, out_ids, terms, weights
+
+
+if numba is not None:
+    @numba.njit(cache=True, boundscheck=False)
+    def count_lines_with_terms(buf, goto, out_start, out_ids, n_terms):
+        """For every term, count the lines of buf that contain it at least once"""
+        counts = np.zeros(n_terms, dtype=np.int64)
+        seen_on_line = np.full(n_terms, -1, dtype=np.int64)
+        line_no = 0
+        state = 0
+        for i in range(buf.shape[0]):
+            byte = buf[i]
+            if byte == 10:
+                line_no += 1
+                state = 0
+                continue
+            state = goto[state, byte]
+            for k in range(out_start[state], out_start[state + 1]):
+                idx = out_ids[k]
+                if seen_on_line[idx] != line_no:
+                    seen_on_line[idx] = line_no
+                    counts[idx] += 1
+        return counts
+
+
+def summarize_timestamps(events: List[Dict], limit: int = PROMPT_TIMESTAMPS) -> str:
+    """
+    Join the timestamps of the first and last events for the prompt.
+    
+    Args:
+        events (List[Dict]): Startup or stop events
+        limit (int): Number of timestamps kept from each end
+        
+    Returns:
+        str: Comma-separated timestamps, with the number left out in the middle
+    """
+    if len(events) <= 2 * limit:
+        return ", ".join(e['timestamp'] for e in events)
+    return ", ".join([
+        *(e['timestamp'] for e in events[:limit]),
+        f"... {len(events) - 2 * limit} more ...",
+        *(e['timestamp'] for e in events[-limit:]),
+    ])
+
+
+def prefetch(log_files: List[Tuple[str, int]], budget: int = PREFETCH_BYTES) -> None:
+    """
+    Queue asynchronous readahead for the files about to be scanned.
+    
+    The kernel starts reading the files in the background, so disk reads for
+    later files overlap with scanning of earlier ones. A no-op where
+    posix_fadvise is unavailable.
+    
+    Args:
+        log_files (List[Tuple[str, int]]): (path, size) pairs in scan order
+        budget (int): Stop after hinting this many bytes
+    """
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    for log_file, size in log_files:
+        if budget <= 0:
+            break
+        try:
+            with open(log_file, 'rb') as file:
+                os.posix_fadvise(file.fileno(), 0, 0, os.POSIX_FADV_WILLNEED)
+        except OSError:
+            continue
+        budget -= size
@@ -0,0 +1,165 @@
+"""
+On-disk cache of LLM responses for LogAnalyzer summaries.
+"""
+
+import hashlib
+from contextlib import closing
+import os
+import sqlite3
+import time
+from functools import wraps
+from typing import Callable, Dict, Iterable, Iterator, Optional
+
+DEFAULT_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "log_analyzer", "llm_cache.db")
+DEFAULT_TTL_SECONDS = 24 * 60 * 60
+DEFAULT_MAX_ENTRIES = 1000
+
+
+class ResponseCache:
+    """
+    SQLite-backed LRU cache of LLM responses keyed by SHA-256 of model and prompt.
+
+    Entries expire after ttl seconds; beyond max_entries the least recently
+    used ones are evicted. Any database error is treated as a cache miss, so
+    a broken cache never stops a summary from being generated.
+    """
+
+    def __init__(self, path: str = DEFAULT_CACHE_PATH, ttl: int = DEFAULT_TTL_SECONDS,
+                 max_entries: int = DEFAULT_MAX_ENTRIES):
+        """
+        Initialize the cache. The database is created on first use.
+
+        Args:
+            path (str): Location of the SQLite database file
+            ttl (int): Seconds a response stays valid
+            max_entries (int): Number of responses kept
+        """
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._ready = False  # Directory and table exist
+
+    @staticmethod
+    def key(model: str, prompt: str) -> str:
+        """
+        Cache key of a request.
+
+        Args:
+            model (str): LLM model name
+            prompt (str): Prompt text
+
+        Returns:
+            str: Hex SHA-256 of model and prompt
+        """
+        return hashlib.sha256(f"{model}\n{prompt}".encode('utf-8')).hexdigest()
+
+    def _connect(self) -> sqlite3.Connection:
+        # The directory and table are created on the first connection only
+        if not self._ready:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=5)
+        if not self._ready:
+            try:
+                with conn:
+                    conn.execute(
+                        "CREATE TABLE IF NOT EXISTS responses "
+                        "(key TEXT PRIMARY KEY, response TEXT, ts INTEGER, used REAL)"
+                    )
+            except sqlite3.Error:
+                conn.close()
+                raise
+            self._ready = True
+        return conn
+
+    def get(self, model: str, prompt: str) -> Optional[str]:
+        """
+        Look up a cached response.
+
+        Args:
+            model (str): LLM model name
+            prompt (str): Prompt text
+
+        Returns:
+            str: The cached response, or None on a miss or expired entry
+        """
+        now = time.time()
+        try:
+            with closing(self._connect()) as conn, conn:
+                row = conn.execute(
+                    "SELECT response FROM responses WHERE key = ? AND ts > ?",
+                    (self.key(model, prompt), int(now) - self.ttl)
+                ).fetchone()
+                if row is not None:
+                    conn.execute("UPDATE responses SET used = ? WHERE key = ?",
+                                 (now, self.key(model, prompt)))
+        except (OSError, sqlite3.Error):
+            return None
+        return row[0] if row else None
+
+    def put(self, model: str, prompt: str, response: str) -> None:
+        """
+        Store a response and evict expired and least recently used entries.
+
+        Args:
+            model (str): LLM model name
+            prompt (str): Prompt text
+            response (str): Response text to cache
+        """
+        now = time.time()
+        try:
+            with closing(self._connect()) as conn, conn:
+                conn.execute("INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?)",
+                             (self.key(model, prompt), response, int(now), now))
+                conn.execute("DELETE FROM responses WHERE ts <= ?", (int(now) - self.ttl,))
+                # used has sub-second resolution; a replaced row gets a new
+                # rowid, so the later write wins any remaining tie
+                conn.execute(
+                    "DELETE FROM responses WHERE key NOT IN "
+                    "(SELECT key FROM responses ORDER BY used DESC, rowid DESC LIMIT ?)",
+                    (self.max_entries,)
+                )
+        except (OSError, sqlite3.Error):
+            pass
+
+
+def _store_when_done(cache: ResponseCache, model: str, prompt: str,
+                     chunks: Iterable[Dict]) -> Iterator[Dict]:
+    """Pass streamed chunks through and cache the full text after the last one"""
+    parts = []
+    for chunk in chunks:
+        parts.append(chunk['response'])
+        yield chunk
+    cache.put(model, prompt, ''.join(parts))
+
+
+def cached_call(cache: ResponseCache) -> Callable:
+    """
+    Decorate an ollama.generate-style function with a response cache.
+
+    The wrapped function must be called with model and prompt keywords and
+    return a mapping with a 'response' key, or an iterator of such chunks
+    when called with stream=True. Hits return the cached text in the same
+    shape without calling it; streamed responses are stored once complete.
+
+    Args:
+        cache (ResponseCache): Cache to read and fill
+
+    Returns:
+        Callable: Decorator
+    """
+    def decorator(generate: Callable) -> Callable:
+        @wraps(generate)
+        def wrapper(*, model: str, prompt: str, **kwargs):
+            cached = cache.get(model, prompt)
+            if kwargs.get('stream'):
+                if cached is not None:
+                    return iter([{'response': cached}])
+                return _store_when_done(cache, model, prompt,
+                                        generate(model=model, prompt=prompt, **kwargs))
+            if cached is not None:
+                return {'response': cached}
+            response = generate(model=model, prompt=prompt, **kwargs)
+            cache.put(model, prompt, response['response'])
+            return response
+        return wrapper
+    return decorator
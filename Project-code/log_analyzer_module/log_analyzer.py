@@ -1,12 +1,178 @@
 import os
+import sys
+import json
+import logging
 import re
-import glob
+import mmap
 import time
+import threading
+from array import array
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Optional, Union
+from queue import Queue
+from functools import lru_cache, partial
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
 import ollama
 
+from .helpers import (PROMPT_TIMESTAMPS, build_automaton, build_table, numba, prefetch,
+                      summarize_timestamps)
+from .llm_cache import ResponseCache, cached_call
+from .reporting import OUTPUT_LOCK
+
+if numba is not None:
+    from .helpers import count_lines_with_terms, np
+
+log = logging.getLogger(__name__)
+
+try:
+    import hyperscan  # optional: SIMD multi-pattern matcher for the search terms
+except ImportError:
+    hyperscan = None
+
+try:
+    # watchdog, optional: wakes monitoring on file change instead of polling
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:
+    Observer = None
+
+# Below this many bytes in total, starting worker processes costs more than
+# scanning the files in this one
+PARALLEL_MIN_BYTES = 8 * 1024 * 1024
+
+# Summaries of prompts seen before are answered from disk instead of the LLM
+_generate = cached_call(ResponseCache())(ollama.generate)
+
+# Fixed instructions first, figures last, so consecutive prompts share the
+# longest possible prefix for the model server's prompt cache
+_PROMPT_TEMPLATE = """
+        You are a log analyst. Please provide a professional "Executive Summary" 
+        of the system health from the technical analysis of the application logs 
+        below. Highlight any potential uptime issues based on the start/stop times 
+        and flag high frequencies of specific errors.
+        
+        1. Startup Events Detected: {startup_count}
+           Timestamps: [{startup_timestamps}]
+        
+        2. Shutdown Events Detected: {stop_count}
+           Timestamps: [{stop_timestamps}]
+           
+        3. Critical Message Counts:
+           {message_counts}
+        """
+
+# File in the log directory that keeps scan positions across restarts
+STATE_FILE_NAME = ".log_analyzer_state.json"
+
+# Read size for the bytes appended to a file between monitoring scans
+DELTA_CHUNK_BYTES = 1024 * 1024
+
+# Quiet period after the last change event before the changed files are
+# scanned, so a burst of writes triggers a single scan
+WATCH_DEBOUNCE_SECONDS = 1.0
+
+# Monitoring batches new events into one LLM summary per window, unless
+# this many events pile up first
+SUMMARY_WINDOW_SECONDS = 60
+SUMMARY_MAX_PENDING_EVENTS = 100
+
+
+def _build_database(search_list: List[str]):
+    """
+    Compile the search terms into a Hyperscan block-mode database.
+    
+    Pattern ids are positions in search_list, so matches index the hit
+    counts directly. Every byte is written as a \\xHH escape, so terms are
+    matched literally.
+    
+    Args:
+        search_list (List[str]): Message patterns to count
+        
+    Returns:
+        The database, or None if hyperscan is missing or a term is empty
+    """
+    if hyperscan is None or not search_list or not all(search_list):
+        return None
+    patterns = [b''.join(b'\\x%02x' % byte for byte in msg.encode('utf-8'))
+                for msg in search_list]
+    database = hyperscan.Database()
+    database.compile(
+        expressions=patterns,
+        ids=list(range(len(patterns))),
+        elements=len(patterns),
+        flags=[0] * len(patterns)
+    )
+    return database
+
+
+@lru_cache(maxsize=64)
+def _build_scanner(startup_msg: str, stop_msg: str, search_list: Tuple[str, ...]):
+    """
+    Compile the patterns for one configuration, once per process.
+    
+    Monitoring loops and batch runs create analyzers for the same
+    configuration over and over; they all share these objects.
+    
+    Args:
+        startup_msg (str): String pattern to identify startup events
+        stop_msg (str): String pattern to identify shutdown events
+        search_list (Tuple[str, ...]): Message patterns to count
+        
+    Returns:
+        Tuple of (combined bytes regex, timestamp regex, automaton or None,
+        numba tables or None, Hyperscan database or None); the first
+        available of Hyperscan, numba and pyahocorasick is built
+    """
+    database = _build_database(list(search_list))
+    table = build_table(list(search_list)) if database is None else None
+    automaton = (build_automaton(list(search_list))
+                 if database is None and table is None else None)
+    
+    # One alternation of every pattern, run over whole files as bytes so
+    # lines without any hit are never cut out or decoded. When Hyperscan or
+    # the numba kernel counts the terms, only events are left for the regex.
+    bulk = database is not None or table is not None
+    gated = [startup_msg, stop_msg] + ([] if bulk else list(search_list))
+    scan_re = re.compile(b'|'.join(re.escape(msg.encode('utf-8')) for msg in gated))
+    time_pattern = re.compile(r'(\d{2}-\d{2}-\d{4} \d{2}:\d{2}:\d{2})')
+    return scan_re, time_pattern, automaton, table, database
+
+
+if Observer is not None:
+    class _LogChangeHandler(FileSystemEventHandler):
+        """Collect changed .log files and scan them once writes go quiet"""
+        
+        def __init__(self, analyzer: 'LogAnalyzer', debounce: float = WATCH_DEBOUNCE_SECONDS):
+            super().__init__()
+            self._analyzer = analyzer
+            self._debounce = debounce
+            self._pending = set()
+            self._lock = threading.Lock()
+            self._scan_lock = threading.Lock()  # One scan at a time
+            self._timer = None
+        
+        def on_modified(self, event):
+            if event.is_directory or not event.src_path.endswith('.log'):
+                return
+            with self._lock:
+                self._pending.add(event.src_path)
+                if self._timer is not None:
+                    self._timer.cancel()
+                self._timer = threading.Timer(self._debounce, self._flush)
+                self._timer.daemon = True
+                self._timer.start()
+        
+        on_created = on_modified
+        
+        def _flush(self):
+            with self._lock:
+                log_files, self._pending = sorted(self._pending), set()
+                self._timer = None
+            with self._scan_lock:
+                self._analyzer._scan_changed_files(log_files)
+
+
 class LogAnalyzer:
     """
     A class for analyzing log files and generating AI-powered summaries.
@@ -17,7 +183,8 @@ class LogAnalyzer:
     """
     
     def __init__(self, directory_path: str, startup_msg: str, stop_msg: str, 
-                 search_list: List[str], monitor_interval: int = 60):
+                 search_list: Iterable[str], monitor_interval: int = 60,
+                 persist_state: bool = True):
         """
         Initialize the LogAnalyzer.
         
@@ -25,21 +192,136 @@ class LogAnalyzer:
             directory_path (str): Path to directory containing log files
             startup_msg (str): String pattern to identify startup events
             stop_msg (str): String pattern to identify shutdown events  
-            search_list (List[str]): List of message patterns to count
+            search_list (Iterable[str]): Message patterns to count
             monitor_interval (int): Seconds between scans for continuous monitoring
+            persist_state (bool): Keep monitoring's file positions in the log
+                directory so a restarted monitor only scans what was appended
+                meanwhile
         """
         self.directory_path = directory_path
         self.startup_msg = startup_msg
         self.stop_msg = stop_msg
-        self.search_list = search_list
+        self.search_list = list(search_list)
         self.monitor_interval = monitor_interval
-        self.time_pattern = re.compile(r'(\d{2}-\d{2}-\d{4} \d{2}:\d{2}:\d{2})')
+        (self._scan_re, self.time_pattern, self._automaton,
+         self._table, self._database) = _build_scanner(
+            startup_msg, stop_msg, tuple(self.search_list)
+        )
+        self._term_lengths = [len(msg.encode('utf-8')) for msg in self.search_list]
+        self._scratch = None  # Hyperscan scratch space, allocated on the first scan
         self.file_positions = {}  # Track file read positions for continuous monitoring
+        self._file_inodes = {}  # Detect rotated or replaced files between scans
+        self._delta_buffer = None  # Read buffer reused by every delta scan
+        self._last_signature = None  # Shape of the last summarized delta
+        self._summary_thread = None  # Streams queued summaries one after another
+        self._summary_queue = Queue()  # Prompts waiting for the summary thread
+        self._pending_stats = {
+            "startup_events": [],
+            "stop_events": [],
+            "message_counts": Counter()
+        }  # New events not summarized yet
+        self._pending_lock = threading.Lock()
+        self._last_summary_time = 0.0
+        self._state_path = (os.path.join(directory_path, STATE_FILE_NAME)
+                            if persist_state else None)
+        
+    def __getstate__(self) -> Dict:
+        # Worker processes only scan; the summary thread and lock stay here
+        state = self.__dict__.copy()
+        state['_summary_thread'] = None
+        state['_delta_buffer'] = None
+        state['_scratch'] = None
+        del state['_summary_queue']
+        del state['_pending_lock']
+        if self._database is not None:
+            state['_database'] = hyperscan.dumpb(self._database)
+        return state
+    
+    def __setstate__(self, state: Dict) -> None:
+        if state['_database'] is not None:
+            state['_database'] = hyperscan.loadb(state['_database'], hyperscan.HS_MODE_BLOCK)
+        self.__dict__.update(state)
+        self._summary_queue = Queue()
+        self._pending_lock = threading.Lock()
+    
+    def _load_state(self) -> bool:
+        """
+        Restore file positions saved by an earlier run.
+        
+        Returns:
+            bool: True if saved positions were found
+        """
+        if self._state_path is None:
+            return False
+        try:
+            with open(self._state_path, 'r', encoding='utf-8') as state_file:
+                state = json.load(state_file)
+        except FileNotFoundError:
+            return False
+        except (OSError, ValueError) as e:
+            log.warning("Ignoring unreadable state file %s: %s", self._state_path, e)
+            return False
+        
+        # Entries are keyed by file name so the state survives a different
+        # spelling of directory_path; a changed inode is caught by _scan_delta
+        try:
+            restored = {
+                os.path.join(self.directory_path, name): (int(entry["position"]), entry["inode"])
+                for name, entry in state.items()
+            }
+        except (AttributeError, KeyError, TypeError, ValueError) as e:
+            log.warning("Ignoring malformed state file %s: %s", self._state_path, e)
+            return False
+        for log_file, (position, inode) in restored.items():
+            self.file_positions[log_file] = position
+            self._file_inodes[log_file] = inode
+        return bool(restored)
+    
+    def _save_state(self) -> None:
+        """Atomically write the current file positions to the state file"""
+        if self._state_path is None:
+            return
+        state = {
+            os.path.basename(log_file): {
+                "position": position,
+                "inode": self._file_inodes.get(log_file),
+            }
+            for log_file, position in self.file_positions.items()
+        }
+        tmp_path = self._state_path + ".tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as state_file:
+                json.dump(state, state_file)
+            os.replace(tmp_path, self._state_path)
+        except OSError as e:
+            log.warning("Could not save state file %s: %s", self._state_path, e)
+    
+    def _iter_log_files(self) -> Iterator[Tuple[str, os.stat_result]]:
+        """
+        List the .log files in the directory in a single pass.
+        
+        scandir hands back each entry's stat with the listing, so no
+        separate stat call is made per file.
         
-    def parse_logs(self) -> Optional[Dict]:
+        Yields:
+            Tuple of (path, stat result) for every log file
+        """
+        if not os.path.isdir(self.directory_path):
+            return
+        with os.scandir(self.directory_path) as entries:
+            for entry in entries:
+                if (entry.name.endswith('.log') and not entry.name.startswith('.')
+                        and entry.is_file()):
+                    yield entry.path, entry.stat()
+    
+    def parse_logs(self, partial_line: bool = True) -> Optional[Dict]:
         """
         Parse all log files and extract events and message counts.
         
+        Args:
+            partial_line (bool): Also process an unterminated last line;
+                monitoring passes False and reads it once it is complete
+        
         Returns:
             Dict containing startup_events, stop_events, and message_counts,
             or None if no log files found
@@ -50,23 +332,53 @@ class LogAnalyzer:
             "message_counts": Counter()
         }
         
-        log_files = glob.glob(f"{self.directory_path}/*.log")
+        sizes = [(path, file_stat.st_size) for path, file_stat in self._iter_log_files()]
 
-        if not log_files:
-            print("No log files found in the specified directory.")
+        if not sizes:
+            log.warning("No log files found in the specified directory.")
             return None
         
-        print(f"No. of files to scan: {len(log_files)}")
+        log.info("No. of files to scan: %d", len(sizes))
+        
+        log_files = [path for path, _ in sizes]
+        process = partial(self._process_log_file, partial_line=partial_line)
+        prefetch(sizes)
         
-        for log_file in log_files:
-            self._process_log_file(log_file, stats)
+        # Files are independent, so large batches are scanned in parallel
+        total_size = sum(size for _, size in sizes)
+        if len(log_files) > 1 and total_size >= PARALLEL_MIN_BYTES:
+            workers = min(len(log_files), os.cpu_count() or 1)
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(process, log_files, chunksize=4))
+        else:
+            results = [process(log_file) for log_file in log_files]
+        
+        # Workers cannot log (their records never reach the parent's
+        # listener), so errors and details come back with the results
+        for log_file, result in zip(log_files, results):
+            if isinstance(result, OSError):
+                log.error("Error reading file %s: %s", log_file, result)
+                continue
+            file_stats, position, scanned, inode = result
+            log.debug("Scanned %s: %d bytes", log_file, scanned)
+            stats["startup_events"].extend(file_stats["startup_events"])
+            stats["stop_events"].extend(file_stats["stop_events"])
+            stats["message_counts"].update(file_stats["message_counts"])
             
+            # Let continuous monitoring pick up from here
+            self.file_positions[log_file] = position
+            self._file_inodes[log_file] = inode
+        
         return stats
     
-    def parse_new_logs_only(self) -> Optional[Dict]:
+    def parse_new_logs_only(self, log_files: Optional[Iterable[str]] = None) -> Optional[Dict]:
         """
         Parse only new log entries since last scan (for continuous monitoring).
         
+        Args:
+            log_files (Iterable[str], optional): Files known to have changed;
+                defaults to every log file in the directory
+        
         Returns:
             Dict containing new events and message counts, or None if no new entries
         """
@@ -76,142 +388,338 @@ class LogAnalyzer:
             "message_counts": Counter()
         }
         
-        log_files = glob.glob(f"{self.directory_path}/*.log")
+        if log_files is None:
+            files = list(self._iter_log_files())
+        else:
+            files = [(log_file, None) for log_file in log_files]
         
-        if not log_files:
+        if not files:
             return None
             
         new_entries_found = False
         
-        for log_file in log_files:
-            # Check if file was modified since last check
+        for log_file, file_stat in files:
             try:
-                file_stat = os.stat(log_file)
-                file_size = file_stat.st_size
-                
-                # Get last known position for this file
-                last_position = self.file_positions.get(log_file, 0)
-                
-                # Only process if file has grown
-                if file_size > last_position:
+                if self._scan_delta(log_file, stats, file_stat):
                     new_entries_found = True
-                    
-                    with open(log_file, 'r', encoding='utf-8') as file:
-                        # Seek to last known position
-                        file.seek(last_position)
-                        
-                        # Process new lines
-                        for line in file:
-                            self._process_log_line(line, log_file, stats)
-                        
-                        # Update file position
-                        self.file_positions[log_file] = file.tell()
-            except IOError as e:
-                print(f"Error reading file {log_file}: {e}")
+            except OSError as e:
+                log.error("Error reading file %s: %s", log_file, e)
         
+        if new_entries_found:
+            self._save_state()
         return stats if new_entries_found else None
     
-    def _process_log_file(self, log_file: str, stats: Dict) -> None:
+    def _scan_delta(self, log_file: str, stats: Dict,
+                    file_stat: Optional[os.stat_result] = None) -> bool:
         """
-        Process a single log file and update statistics.
+        Process only the bytes appended to a log file since the last scan.
+        
+        A file that shrank or whose inode changed was rotated or truncated
+        and is read again from the start. A trailing partial line is left
+        for the next scan so a line being written is never split.
         
         Args:
             log_file (str): Path to the log file
             stats (Dict): Statistics dictionary to update
+            file_stat (os.stat_result, optional): Stat from the directory
+                listing; looked up when not given
+            
+        Returns:
+            bool: True if complete new lines were processed
         """
+        if file_stat is None:
+            file_stat = os.stat(log_file)
+        last_position = self.file_positions.get(log_file, 0)
+        
+        if (self._file_inodes.get(log_file) != file_stat.st_ino
+                or file_stat.st_size < last_position):
+            last_position = 0
+        self._file_inodes[log_file] = file_stat.st_ino
+        
+        if file_stat.st_size <= last_position:
+            self.file_positions[log_file] = last_position
+            return False
+        
+        # A long backlog is read in fixed-size chunks into one buffer kept
+        # across scans and scanned in place; each chunk's unfinished last
+        # line is moved to the front and the next chunk is read in behind it
+        if self._delta_buffer is None:
+            self._delta_buffer = bytearray(DELTA_CHUNK_BYTES)
+        buffer = self._delta_buffer
+        position = last_position
+        filled = 0
+        with open(log_file, 'rb') as file:
+            file.seek(last_position)
+            while True:
+                if filled == len(buffer):
+                    # A single line longer than the buffer
+                    buffer.extend(bytes(len(buffer)))
+                with memoryview(buffer) as view, view[filled:] as free:
+                    read = file.readinto(free)
+                if not read:
+                    break
+                filled += read
+                end = buffer.rfind(b'\n', 0, filled) + 1
+                self._scan_buffer(buffer, end, log_file, stats)
+                position += end
+                buffer[:filled - end] = buffer[end:filled]
+                filled -= end
+        
+        self.file_positions[log_file] = position
+        return position > last_position
+    
+    def _process_log_file(self, log_file: str,
+                          partial_line: bool = True) -> Union[Tuple[Dict, int, int, int], OSError]:
+        """
+        Process a single log file into its own statistics.
+        
+        This runs in worker processes, so nothing is stored on self and
+        nothing is logged; the caller merges the results, records the file
+        positions and reports errors.
+        
+        Args:
+            log_file (str): Path to the log file
+            partial_line (bool): Also process an unterminated last line
+            
+        Returns:
+            Tuple of (statistics, position after the last complete line,
+            bytes scanned, inode), or the error if the file could not be read
+        """
+        stats = {
+            "startup_events": [],
+            "stop_events": [],
+            "message_counts": Counter()
+        }
         try:
-            with open(log_file, 'r', encoding='utf-8') as file:
-                for line in file:
-                    self._process_log_line(line, log_file, stats)
-        except IOError as e:
-            print(f"Error reading file {log_file}: {e}")
+            with open(log_file, 'rb') as file:
+                file_stat = os.fstat(file.fileno())
+                size = position = 0
+                # mmap cannot map an empty file
+                if file_stat.st_size:
+                    with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                        # A line still being written is resumed from its start
+                        position = data.rfind(b'\n') + 1
+                        size = len(data) if partial_line else position
+                        self._scan_buffer(data, size, log_file, stats)
+        except OSError as e:
+            return e
+        return stats, position, size, file_stat.st_ino
     
-    def _process_log_line(self, line: str, log_file: str, stats: Dict) -> None:
+    def _scan_buffer(self, data, size: int, log_file: str, stats: Dict) -> None:
         """
-        Process a single log line and update statistics.
+        Process every line of a buffer that holds at least one pattern.
+        
+        The combined regex jumps from hit to hit over the raw bytes; only
+        the lines around the hits are decoded and processed.
         
         Args:
-            line (str): Log line to process
+            data: bytes, bytearray or mmap with the file contents
+            size (int): Number of leading bytes of data to scan
             log_file (str): Source file path
             stats (Dict): Statistics dictionary to update
         """
-        time_match = self.time_pattern.search(line)
-        timestamp = time_match.group(0) if time_match else "Unknown Time"
+        # Hits are counted by position in search_list and only turned into
+        # message_counts entries once the buffer is done
+        counts = array('q', bytes(8 * len(self.search_list)))
+        file_name = os.path.basename(log_file)
+        
+        if self._database is not None:
+            self._count_with_database(data, size, counts)
+        elif self._table is not None:
+            goto, out_start, out_ids, terms, weights = self._table
+            term_counts = count_lines_with_terms(
+                np.frombuffer(data, dtype=np.uint8, count=size),
+                goto, out_start, out_ids, len(terms)
+            )
+            for msg, weight, count in zip(terms, weights, term_counts):
+                if count:
+                    stats["message_counts"][msg] += weight * int(count)
+        
+        pos = 0
+        while pos < size:
+            match = self._scan_re.search(data, pos, size)
+            if not match:
+                break
+            start = data.rfind(b'\n', 0, match.start()) + 1
+            end = data.find(b'\n', match.end(), size)
+            if end == -1:
+                end = size
+            pos = end + 1
+            self._process_log_line(data[start:end].decode('utf-8', errors='replace'), file_name, stats, counts)
+        
+        for msg, count in zip(self.search_list, counts):
+            if count:
+                stats["message_counts"][msg] += count
+    
+    def _count_with_database(self, data, size: int, counts: array) -> None:
+        """
+        Count the lines holding each search term with the Hyperscan database.
+        
+        Args:
+            data: bytes, bytearray or mmap with the file contents
+            size (int): Number of leading bytes of data to scan
+            counts (array): Hit counts indexed by position in search_list
+        """
+        rfind = data.rfind
+        lengths = self._term_lengths
+        last_line = [-1] * len(counts)  # Start of the line each term was last counted on
+        
+        def on_match(idx, _start, end, _flags, _context):
+            line_start = rfind(b'\n', 0, end - lengths[idx]) + 1
+            if last_line[idx] != line_start:
+                last_line[idx] = line_start
+                counts[idx] += 1
+        
+        # Scans run one at a time per analyzer, so one scratch serves them all
+        if self._scratch is None:
+            self._scratch = hyperscan.Scratch(self._database)
+        with memoryview(data) as whole, whole[:size] as view:
+            self._database.scan(view, match_event_handler=on_match, scratch=self._scratch)
+    
+    def _process_log_line(self, line: str, file_name: str, stats: Dict, counts: array) -> None:
+        """
+        Process a single log line and update statistics.
+        
+        Args:
+            line (str): Log line to process
+            file_name (str): Base name of the source file
+            stats (Dict): Statistics dictionary to update with events
+            counts (array): Hit counts indexed by position in search_list
+        """
+        is_startup = self.startup_msg in line
+        is_stop = self.stop_msg in line
+        
+        # Only event lines need their timestamp
+        if is_startup or is_stop:
+            time_match = self.time_pattern.search(line)
+            timestamp = time_match.group(0) if time_match else "Unknown Time"
 
         # Check for startup events
-        if self.startup_msg in line:
+        if is_startup:
             stats["startup_events"].append({
                 "timestamp": timestamp, 
-                "file": os.path.basename(log_file), 
+                "file": file_name, 
                 "line": line.strip()
             })
         
         # Check for stop events
-        if self.stop_msg in line:
+        if is_stop:
             stats["stop_events"].append({
                 "timestamp": timestamp, 
-                "file": os.path.basename(log_file), 
+                "file": file_name, 
                 "line": line.strip()
             })
         
-        # Count search terms
-        for msg in self.search_list:
-            if msg in line:
-                stats["message_counts"][msg] += 1
+        # Count search terms; the automaton finds all of them in one pass,
+        # the set keeps a term that occurs twice on a line counted once.
+        # Hyperscan or the numba kernel has already counted them over the
+        # whole buffer.
+        if self._database is not None or self._table is not None:
+            return
+        if self._automaton is not None:
+            for ids in {value for _, value in self._automaton.iter(line)}:
+                for idx in ids:
+                    counts[idx] += 1
+        else:
+            for idx, msg in enumerate(self.search_list):
+                if msg in line:
+                    counts[idx] += 1
     
-    def generate_ai_summary(self, stats: Dict, model: str = 'llama2') -> None:
+    def generate_ai_summary(self, stats: Dict, model: str = 'llama2',
+                            background: bool = False,
+                            keep_alive: Optional[Union[int, str]] = None) -> None:
         """
         Generate AI-powered executive summary of log analysis.
         
+        The response is streamed to stdout as the model produces it.
+        
         Args:
             stats (Dict): Statistics from parse_logs()
             model (str): LLM model to use for summary generation
+            background (bool): Queue the summary for the background summary
+                thread and return at once; queued summaries stream in order
+            keep_alive (int or str, optional): How long Ollama keeps the model
+                loaded afterwards, e.g. "5m"; None leaves the server default
         """
         if not stats:
-            print("No statistics available for summary generation.")
+            log.warning("No statistics available for summary generation.")
             return
 
         prompt_data = self._build_prompt(stats)
         
-        print(f"\n--- Sending data to Local LLM ({model}) ---")
+        if not background:
+            self._stream_summary(prompt_data, model, keep_alive)
+            return
+        
+        # One long-lived thread drains the queue, so the caller never waits
+        # for a summary that is still streaming
+        if self._summary_thread is None:
+            self._summary_thread = threading.Thread(target=self._summary_worker, daemon=True)
+            self._summary_thread.start()
+        self._summary_queue.put((prompt_data, model, keep_alive))
+    
+    def _summary_worker(self) -> None:
+        """Stream the queued background summaries one at a time"""
+        while True:
+            prompt_data, model, keep_alive = self._summary_queue.get()
+            try:
+                self._stream_summary(prompt_data, model, keep_alive)
+            finally:
+                self._summary_queue.task_done()
+    
+    def _stream_summary(self, prompt_data: str, model: str,
+                        keep_alive: Optional[Union[int, str]] = None) -> None:
+        """
+        Send a prompt to the LLM and print the response as it streams in.
+        
+        Args:
+            prompt_data (str): Prompt from _build_prompt()
+            model (str): LLM model to use for summary generation
+            keep_alive (int or str, optional): Passed on to Ollama; None
+                leaves the server default
+        """
+        log.info("Sending data to Local LLM (%s)", model)
         try:
-            response = ollama.generate(
+            chunks = _generate(
                 model=model,
-                prompt=prompt_data
+                prompt=prompt_data,
+                keep_alive=keep_alive,
+                stream=True
             )
-            print("\n=== AI LOG ANALYSIS SUMMARY ===\n")
-            print(response['response'])
+            # Status lines logged meanwhile wait in the logging queue until
+            # the whole summary has been written
+            with OUTPUT_LOCK:
+                sys.stdout.write("\n=== AI LOG ANALYSIS SUMMARY ===\n\n")
+                for chunk in chunks:
+                    sys.stdout.write(chunk['response'])
+                    sys.stdout.flush()
+                sys.stdout.write("\n")
             
         except Exception as e:
-            print(f"Error connecting to Local LLM: {e}")
-            print("Ensure Ollama is running ('ollama serve') and the model is pulled.")
+            # The client raises different types across ollama versions
+            log.error("Error connecting to Local LLM: %s", e)
+            log.error("Ensure Ollama is running ('ollama serve') and the model is pulled.")
     
     def _build_prompt(self, stats: Dict) -> str:
         """
         Build the prompt for the LLM.
         
+        Only the first and last PROMPT_TIMESTAMPS timestamps of each event
+        type are listed, so the prompt stays small and deterministic.
+        
         Args:
             stats (Dict): Statistics dictionary
             
         Returns:
             str: Formatted prompt for the LLM
         """
-        return f"""
-        Here is the technical analysis of the application logs:
-        
-        1. Startup Events Detected: {len(stats['startup_events'])}
-           Timestamps: {[e['timestamp'] for e in stats['startup_events']]}
-        
-        2. Shutdown Events Detected: {len(stats['stop_events'])}
-           Timestamps: {[e['timestamp'] for e in stats['stop_events']]}
-           
-        3. Critical Message Counts:
-           {dict(stats['message_counts'])}
-        
-        Please provide a professional "Executive Summary" of the system health. 
-        Highlight any potential uptime issues based on the start/stop times and 
-        flag high frequencies of specific errors.
-        """
+        return _PROMPT_TEMPLATE.format_map({
+            "startup_count": len(stats['startup_events']),
+            "startup_timestamps": summarize_timestamps(stats['startup_events']),
+            "stop_count": len(stats['stop_events']),
+            "stop_timestamps": summarize_timestamps(stats['stop_events']),
+            "message_counts": dict(stats['message_counts']),
+        })
     
     def run_analysis(self, generate_summary: bool = True, model: str = 'llama2') -> Optional[Dict]:
         """
@@ -233,42 +741,145 @@ class LogAnalyzer:
     
     def run_continuous_monitoring(self):
         """Run continuous log monitoring with change detection"""
-        print(f"🚀 Starting continuous log monitoring...")
-        print(f"📁 Directory: {self.directory_path}")
-        print(f"⏱️  Scan interval: {self.monitor_interval} seconds")
-        print("⏹️  Press Ctrl+C to stop\n")
-        
-        # Initial scan to set file positions
-        print("📋 Initial scan...")
-        initial_data = self.parse_logs()
+        log.info("🚀 Starting continuous log monitoring...")
+        log.info("📁 Directory: %s", self.directory_path)
+        if Observer is None:
+            log.info("⏱️  Scan interval: %d seconds", self.monitor_interval)
+        else:
+            log.info("👀 Watching for file changes")
+        log.info("⏹️  Press Ctrl+C to stop")
+        
+        # Initial scan to set file positions; after a restart only what was
+        # appended while the monitor was down is scanned
+        if self._load_state():
+            log.info("📋 Catching up since the last run...")
+            initial_data = self.parse_new_logs_only()
+        else:
+            log.info("📋 Initial scan...")
+            initial_data = self.parse_logs(partial_line=False)
+            self._save_state()
         if initial_data:
-            self.generate_ai_summary(initial_data)
+            self.generate_ai_summary(initial_data, keep_alive=self._monitor_keep_alive())
         
         try:
-            scan_count = 0
-            while True:
-                scan_count += 1
-                timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                
-                print(f"[{timestamp}] 🔍 Scan #{scan_count} - Checking for new entries...")
-                
-                # Check for new log entries only
-                new_data = self.parse_new_logs_only()
-                
-                if new_data and any([
-                    new_data['startup_events'],
-                    new_data['stop_events'], 
-                    new_data['message_counts']
-                ]):
-                    print("🆕 New events detected!")
-                    self.generate_ai_summary(new_data)
-                else:
-                    print("✅ No new events detected.")
-                
-                print(f"⏳ Next scan in {self.monitor_interval} seconds...\n")
-                time.sleep(self.monitor_interval)
+            if Observer is None:
+                self._poll_for_changes()
+            else:
+                self._watch_for_changes()
                 
         except KeyboardInterrupt:
-            print("\n🛑 Monitoring stopped by user.")
-        except Exception as e:
-            print(f"❌ Error in monitoring: {e}")
\ No newline at end of file
+            log.info("🛑 Monitoring stopped by user.")
+    
+    def _monitor_keep_alive(self) -> str:
+        """
+        How long Ollama should keep the model loaded between monitoring summaries.
+        
+        Long enough that the next batch finds the model warm, so it skips the
+        cold load and can reuse the cached prefill of the prompt's fixed
+        instructions; finite, so the model is unloaded once monitoring stops.
+        
+        Returns:
+            str: Ollama duration of twice the longest gap between summaries
+        """
+        return f"{2 * max(SUMMARY_WINDOW_SECONDS, self.monitor_interval)}s"
+    
+    def _poll_for_changes(self) -> None:
+        """Rescan the directory every monitor_interval seconds"""
+        scan_count = 0
+        while True:
+            scan_count += 1
+            timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            
+            log.info("[%s] 🔍 Scan #%d - Checking for new entries...", timestamp, scan_count)
+            
+            # Check for new log entries only
+            self._report_new_data(self.parse_new_logs_only())
+            
+            log.info("⏳ Next scan in %d seconds...", self.monitor_interval)
+            time.sleep(self.monitor_interval)
+    
+    def _watch_for_changes(self) -> None:
+        """Block until interrupted, scanning files as the OS reports changes"""
+        observer = Observer()
+        observer.schedule(_LogChangeHandler(self), self.directory_path, recursive=False)
+        observer.start()
+        try:
+            while observer.is_alive():
+                observer.join(1)
+                # Summarize a batch whose window ran out without new changes
+                self._flush_pending()
+        finally:
+            observer.stop()
+            observer.join()
+    
+    def _scan_changed_files(self, log_files: List[str]) -> None:
+        """
+        Scan the files a change event reported and report what is new.
+        
+        Args:
+            log_files (List[str]): Paths of the changed log files
+        """
+        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        log.info("[%s] 🔍 %d file(s) changed - Checking for new entries...", timestamp, len(log_files))
+        self._report_new_data(self.parse_new_logs_only(log_files))
+    
+    def _report_new_data(self, new_data: Optional[Dict]) -> None:
+        """
+        Add newly found entries to the pending batch and summarize it when due.
+        
+        Args:
+            new_data (Dict, optional): Result of parse_new_logs_only()
+        """
+        if new_data and any([
+            new_data['startup_events'],
+            new_data['stop_events'], 
+            new_data['message_counts']
+        ]):
+            log.info("🆕 New events detected!")
+            with self._pending_lock:
+                self._pending_stats["startup_events"].extend(new_data["startup_events"])
+                self._pending_stats["stop_events"].extend(new_data["stop_events"])
+                self._pending_stats["message_counts"].update(new_data["message_counts"])
+            if not self._flush_pending():
+                log.info("⏸️  Batched for the next summary.")
+        else:
+            log.info("✅ No new events detected.")
+            self._flush_pending()
+    
+    def _flush_pending(self) -> bool:
+        """
+        Summarize the pending batch once its window has passed or it grew large.
+        
+        Returns:
+            bool: True if the batch was handed to the LLM or skipped as a repeat
+        """
+        with self._pending_lock:
+            pending = self._pending_stats
+            size = (len(pending["startup_events"]) + len(pending["stop_events"])
+                    + sum(pending["message_counts"].values()))
+            if not size:
+                return False
+            if (time.time() - self._last_summary_time < SUMMARY_WINDOW_SECONDS
+                    and size < SUMMARY_MAX_PENDING_EVENTS):
+                return False
+            self._pending_stats = {
+                "startup_events": [],
+                "stop_events": [],
+                "message_counts": Counter()
+            }
+            self._last_summary_time = time.time()
+            
+            # A batch shaped like the last one would get the same summary
+            signature = (
+                len(pending['startup_events']),
+                len(pending['stop_events']),
+                tuple(sorted(pending['message_counts'].items()))
+            )
+            if signature == self._last_signature:
+                log.info("♻️  Same pattern as the last summary; skipping LLM call.")
+                return True
+            self._last_signature = signature
+        
+        self.generate_ai_summary(pending, background=True,
+                                 keep_alive=self._monitor_keep_alive())
+        return True
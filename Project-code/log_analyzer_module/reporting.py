@@ -0,0 +1,65 @@
+"""
+Console reporting helpers for LogAnalyzer results.
+"""
+
+import atexit
+import logging
+import queue
+import sys
+import threading
+from logging.handlers import QueueHandler, QueueListener
+from typing import Iterable, Optional
+
+PACKAGE_LOGGER = 'log_analyzer_module'
+
+_listener: Optional[QueueListener] = None  # Set once configure_logging has run
+
+# Held by everything that writes to the terminal, so status lines from the
+# logging thread never land inside a streamed summary or a report
+OUTPUT_LOCK = threading.RLock()
+
+
+class _LockedStreamHandler(logging.StreamHandler):
+    """StreamHandler that writes under OUTPUT_LOCK"""
+
+    def emit(self, record: logging.LogRecord) -> None:
+        with OUTPUT_LOCK:
+            super().emit(record)
+
+
+def emit_report(lines: Iterable[str]) -> None:
+    """
+    Write a report to stdout with a single write call.
+
+    Args:
+        lines (Iterable[str]): Report lines without trailing newlines
+    """
+    with OUTPUT_LOCK:
+        sys.stdout.write('\n'.join(lines) + '\n')
+
+
+def configure_logging(level: int = logging.INFO) -> None:
+    """
+    Send the analyzer's status messages to stderr from a background thread.
+
+    Records are queued by the logging call and written by a QueueListener,
+    so scanning and monitoring threads never block on terminal output. Only
+    the package's own logger is configured; calling this again just changes
+    the level.
+
+    Args:
+        level (int): Lowest level to show; logging.DEBUG adds per-file detail
+    """
+    global _listener
+    logger = logging.getLogger(PACKAGE_LOGGER)
+    logger.setLevel(level)
+    if _listener is not None:
+        return
+
+    records = queue.SimpleQueue()
+    handler = _LockedStreamHandler()
+    handler.setFormatter(logging.Formatter('%(message)s'))
+    _listener = QueueListener(records, handler)
+    _listener.start()
+    atexit.register(_listener.stop)
+    logger.addHandler(QueueHandler(records))
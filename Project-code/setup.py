@@ -40,6 +40,14 @@ setup(
             "flake8",
             "mypy",
         ],
+        "fast": [
+            "pyahocorasick>=2.0.0",  # For single-pass search term counting
+            "numba>=0.57",  # For the compiled whole-file term counting kernel
+            "numpy",
+        ],
+        "hyperscan": [
+            "hyperscan>=0.4.0",  # For SIMD multi-pattern term counting (x86-64)
+        ],
         "monitoring": [
             "watchdog>=2.0.0",  # For real-time file monitoring
         ],
@@ -0,0 +1,78 @@
+"""
+Tests for the on-disk LLM response cache.
+"""
+
+import pytest
+
+from log_analyzer_module import llm_cache
+from log_analyzer_module.llm_cache import ResponseCache, cached_call
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ResponseCache(str(tmp_path / "sub" / "cache.db"), max_entries=2)
+
+
+def test_miss_then_hit(cache):
+    assert cache.get("llama2", "prompt") is None
+    cache.put("llama2", "prompt", "answer")
+    assert cache.get("llama2", "prompt") == "answer"
+    assert cache.get("other", "prompt") is None
+
+
+def test_expired_entries_are_misses(cache, monkeypatch):
+    cache.put("llama2", "prompt", "answer")
+    now = llm_cache.time.time()
+    monkeypatch.setattr(llm_cache.time, "time", lambda: now + cache.ttl + 1)
+    assert cache.get("llama2", "prompt") is None
+
+
+def test_least_recently_used_is_evicted_within_one_second(cache, monkeypatch):
+    monkeypatch.setattr(llm_cache.time, "time", lambda: 1000.0)
+    for prompt in "abc":
+        cache.put("llama2", prompt, prompt.upper())
+    assert [cache.get("llama2", prompt) for prompt in "abc"] == [None, "B", "C"]
+
+
+def test_recently_read_entry_survives_eviction(cache):
+    cache.put("llama2", "a", "A")
+    cache.put("llama2", "b", "B")
+    cache.get("llama2", "a")
+    cache.put("llama2", "c", "C")
+    assert cache.get("llama2", "a") == "A"
+    assert cache.get("llama2", "b") is None
+
+
+def test_broken_cache_path_is_a_miss(tmp_path):
+    (tmp_path / "file").write_text("not a directory")
+    cache = ResponseCache(str(tmp_path / "file" / "cache.db"))
+    cache.put("llama2", "prompt", "answer")
+    assert cache.get("llama2", "prompt") is None
+
+
+def make_generate(calls):
+    def generate(*, model, prompt, stream=False, **kwargs):
+        calls.append((model, prompt, kwargs))
+        if stream:
+            return iter([{'response': "streamed "}, {'response': "text"}])
+        return {'response': "plain text"}
+    return generate
+
+
+def test_cached_call_returns_hits_without_calling(cache):
+    calls = []
+    generate = cached_call(cache)(make_generate(calls))
+    assert generate(model="llama2", prompt="p")['response'] == "plain text"
+    assert generate(model="llama2", prompt="p")['response'] == "plain text"
+    assert len(calls) == 1
+
+
+def test_cached_call_stores_completed_streams(cache):
+    calls = []
+    generate = cached_call(cache)(make_generate(calls))
+    first = generate(model="llama2", prompt="p", stream=True, keep_alive=-1)
+    assert cache.get("llama2", "p") is None  # Not stored until the stream ends
+    assert ''.join(chunk['response'] for chunk in first) == "streamed text"
+    replay = list(generate(model="llama2", prompt="p", stream=True))
+    assert replay == [{'response': "streamed text"}]
+    assert calls == [("llama2", "p", {'keep_alive': -1})]
@@ -0,0 +1,306 @@
+"""
+Tests for LogAnalyzer scanning, checked against a plain substring loop.
+"""
+
+import json
+import os
+from collections import Counter
+
+import pytest
+
+from log_analyzer_module import helpers, log_analyzer
+from log_analyzer_module.log_analyzer import STATE_FILE_NAME, LogAnalyzer
+
+STARTUP = "started"
+STOP = "shutdown"
+TERMS = ["ERROR", "timeout", "connection timeout", "ERROR", "é"]
+
+FIXTURES = {
+    "app.log": (
+        "25-12-2024 10:00:00 INFO Service started\n"
+        "25-12-2024 10:00:05 ERROR ERROR twice on one line\n"
+        "25-12-2024 10:00:06 WARNING connection timeout while connecting\n"
+        "no timestamp here but started anyway\n"
+        "25-12-2024 10:01:00 INFO café timeout\n"
+        "25-12-2024 11:00:00 INFO Service shutdown\n"
+    ),
+    "db.log": (
+        "26-12-2024 06:00:00 INFO nothing to see\n"
+        "\n"
+        "26-12-2024 06:00:01 ERROR query timeout started shutdown\n"
+        "26-12-2024 06:00:02 ERROR unterminated last line"
+    ),
+    "empty.log": "",
+}
+
+BACKENDS = ["hyperscan", "numba", "ahocorasick", "plain"]
+
+
+def plain_loop(directory, startup_msg, stop_msg, search_list):
+    """Reference result: every line checked with the in operator"""
+    stats = {"startup_events": [], "stop_events": [], "message_counts": Counter()}
+    for name in sorted(os.listdir(directory)):
+        if not name.endswith('.log') or name.startswith('.'):
+            continue
+        with open(os.path.join(directory, name), encoding='utf-8') as file:
+            for line in file.read().splitlines():
+                for key, msg in (("startup_events", startup_msg), ("stop_events", stop_msg)):
+                    if msg in line:
+                        stats[key].append({"file": name, "line": line})
+                for msg in search_list:
+                    if msg in line:
+                        stats["message_counts"][msg] += 1
+    return stats
+
+
+def comparable(stats):
+    """Drop timestamps and order events by file and line"""
+    return {
+        "startup_events": sorted((e["file"], e["line"]) for e in stats["startup_events"]),
+        "stop_events": sorted((e["file"], e["line"]) for e in stats["stop_events"]),
+        "message_counts": {msg: n for msg, n in stats["message_counts"].items() if n},
+    }
+
+
+def write_logs(directory, files):
+    for name, text in files.items():
+        with open(os.path.join(directory, name), 'w', encoding='utf-8') as file:
+            file.write(text)
+
+
+# Module that imports each optional backend
+BACKEND_MODULES = {"hyperscan": log_analyzer, "numba": helpers, "ahocorasick": helpers}
+
+
+@pytest.fixture(params=BACKENDS)
+def backend(request, monkeypatch):
+    """Force one term-counting backend by hiding the faster ones"""
+    order = BACKENDS[:-1]
+    if request.param != "plain" and getattr(BACKEND_MODULES[request.param], request.param) is None:
+        pytest.skip(f"{request.param} is not installed")
+    hidden = order if request.param == "plain" else order[:order.index(request.param)]
+    for name in hidden:
+        monkeypatch.setattr(BACKEND_MODULES[name], name, None)
+    log_analyzer._build_scanner.cache_clear()
+    yield request.param
+    log_analyzer._build_scanner.cache_clear()
+
+
+@pytest.fixture
+def log_dir(tmp_path):
+    write_logs(tmp_path, FIXTURES)
+    return tmp_path
+
+
+def make_analyzer(directory, search_list=TERMS, **kwargs):
+    return LogAnalyzer(str(directory), STARTUP, STOP, search_list, **kwargs)
+
+
+def test_parse_logs_matches_plain_loop(backend, log_dir):
+    result = make_analyzer(log_dir).parse_logs()
+    assert comparable(result) == comparable(plain_loop(log_dir, STARTUP, STOP, TERMS))
+
+
+def test_parallel_scan_matches_serial(backend, log_dir, monkeypatch):
+    serial = make_analyzer(log_dir).parse_logs()
+    monkeypatch.setattr(log_analyzer, "PARALLEL_MIN_BYTES", 0)
+    parallel = make_analyzer(log_dir).parse_logs()
+    assert comparable(parallel) == comparable(serial)
+
+
+def test_empty_term_counts_every_line(backend, log_dir):
+    result = make_analyzer(log_dir, ["", "ERROR"]).parse_logs()
+    expected = plain_loop(log_dir, STARTUP, STOP, ["", "ERROR"])
+    assert comparable(result) == comparable(expected)
+
+
+def test_timestamps_are_extracted(log_dir):
+    result = make_analyzer(log_dir).parse_logs()
+    timestamps = {e["line"]: e["timestamp"] for e in result["startup_events"]}
+    assert timestamps["25-12-2024 10:00:00 INFO Service started"] == "25-12-2024 10:00:00"
+    assert timestamps["no timestamp here but started anyway"] == "Unknown Time"
+
+
+def test_full_scan_resumes_at_last_complete_line(log_dir):
+    analyzer = make_analyzer(log_dir)
+    analyzer.parse_logs()
+    db_log = str(log_dir / "db.log")
+    assert analyzer.file_positions[db_log] == FIXTURES["db.log"].rfind("\n") + 1
+
+
+@pytest.mark.parametrize("chunk", [8, 64, 1 << 20])
+def test_delta_scan_waits_for_partial_lines(backend, tmp_path, monkeypatch, chunk):
+    monkeypatch.setattr(log_analyzer, "DELTA_CHUNK_BYTES", chunk)
+    write_logs(tmp_path, {"app.log": FIXTURES["app.log"]})
+    analyzer = make_analyzer(tmp_path, persist_state=False)
+    analyzer.parse_logs(partial_line=False)
+    
+    with open(tmp_path / "app.log", 'a', encoding='utf-8') as file:
+        file.write("25-12-2024 12:00:00 ERROR connection ")
+    assert analyzer.parse_new_logs_only() is None
+    
+    with open(tmp_path / "app.log", 'a', encoding='utf-8') as file:
+        file.write("timeout\n25-12-2024 12:00:01 INFO started again\n")
+    result = analyzer.parse_new_logs_only()
+    assert comparable(result) == {
+        "startup_events": [("app.log", "25-12-2024 12:00:01 INFO started again")],
+        "stop_events": [],
+        "message_counts": {"ERROR": 2, "timeout": 1, "connection timeout": 1},
+    }
+    assert analyzer.parse_new_logs_only() is None
+
+
+def test_delta_scan_matches_full_scan(backend, log_dir, monkeypatch):
+    monkeypatch.setattr(log_analyzer, "DELTA_CHUNK_BYTES", 16)
+    full = make_analyzer(log_dir).parse_logs(partial_line=False)
+    delta = make_analyzer(log_dir, persist_state=False).parse_new_logs_only()
+    assert comparable(delta) == comparable(full)
+
+
+def test_rotated_file_is_read_from_start(tmp_path):
+    write_logs(tmp_path, {"app.log": FIXTURES["app.log"]})
+    analyzer = make_analyzer(tmp_path, persist_state=False)
+    analyzer.parse_logs()
+    
+    # Replaced by a new, longer file: same name, different inode
+    rotated = tmp_path / "app.log.new"
+    rotated.write_text("25-12-2024 13:00:00 ERROR after rotation\n" * 200, encoding='utf-8')
+    os.replace(rotated, tmp_path / "app.log")
+    result = analyzer.parse_new_logs_only()
+    assert result["message_counts"] == Counter({"ERROR": 400})
+    
+    # Truncated in place: smaller than the saved position
+    (tmp_path / "app.log").write_text("25-12-2024 14:00:00 INFO Service started\n", encoding='utf-8')
+    result = analyzer.parse_new_logs_only()
+    assert [e["line"] for e in result["startup_events"]] == ["25-12-2024 14:00:00 INFO Service started"]
+
+
+def test_state_is_restored_by_monitoring_only(log_dir, monkeypatch):
+    state_path = log_dir / STATE_FILE_NAME
+    make_analyzer(log_dir).run_analysis(generate_summary=False)
+    assert not state_path.exists()
+    
+    analyzer = make_analyzer(log_dir)
+    analyzer.parse_logs(partial_line=False)
+    with open(log_dir / "app.log", 'a', encoding='utf-8') as file:
+        file.write("25-12-2024 15:00:00 ERROR new\n")
+    analyzer.parse_new_logs_only()
+    state = json.loads(state_path.read_text(encoding='utf-8'))
+    assert state["app.log"]["position"] == os.path.getsize(log_dir / "app.log")
+    
+    restored = make_analyzer(log_dir)
+    assert restored.file_positions == {}
+    assert restored._load_state()
+    assert restored.file_positions == analyzer.file_positions
+    assert restored.parse_new_logs_only() is None
+
+
+@pytest.mark.parametrize("content", [
+    "not json",
+    "[]",
+    '{"app.log": 5}',
+    '{"app.log": {}}',
+    '{"app.log": {"position": "x", "inode": 1}}',
+])
+def test_malformed_state_is_ignored(log_dir, content):
+    (log_dir / STATE_FILE_NAME).write_text(content, encoding='utf-8')
+    analyzer = make_analyzer(log_dir)
+    assert not analyzer._load_state()
+    assert analyzer.file_positions == {}
+
+
+
+def events(count, name="app.log"):
+    return [{"timestamp": f"25-12-2024 10:00:{i:02d}", "file": name, "line": f"started {i}"}
+            for i in range(count)]
+
+
+def batch(startup=0, **counts):
+    return {"startup_events": events(startup), "stop_events": [], "message_counts": Counter(counts)}
+
+
+@pytest.mark.parametrize("count, expected", [
+    (0, ""),
+    (3, "25-12-2024 10:00:00, 25-12-2024 10:00:01, 25-12-2024 10:00:02"),
+    (12, ", ".join([f"25-12-2024 10:00:{i:02d}" for i in range(5)] + ["... 2 more ..."]
+                   + [f"25-12-2024 10:00:{i:02d}" for i in range(7, 12)])),
+])
+def test_summarize_timestamps_keeps_both_ends(count, expected):
+    assert helpers.summarize_timestamps(events(count)) == expected
+
+
+def test_prompt_has_fixed_prefix_and_capped_timestamps(tmp_path):
+    analyzer = make_analyzer(tmp_path, persist_state=False)
+    small = analyzer._build_prompt(batch(startup=1, ERROR=3))
+    large = analyzer._build_prompt(batch(startup=500, ERROR=3, timeout=1))
+    
+    prefix = log_analyzer._PROMPT_TEMPLATE.split("{")[0]
+    assert small.startswith(prefix) and large.startswith(prefix)
+    assert "Startup Events Detected: 500" in large
+    assert "... 490 more ..." in large
+    assert large.count("25-12-2024") == 2 * log_analyzer.PROMPT_TIMESTAMPS
+    assert "{'ERROR': 3, 'timeout': 1}" in large
+
+
+@pytest.fixture
+def monitor(tmp_path, monkeypatch):
+    """Analyzer whose summaries are recorded instead of sent to the LLM"""
+    analyzer = make_analyzer(tmp_path, persist_state=False)
+    analyzer.summaries = []
+    monkeypatch.setattr(analyzer, "generate_ai_summary",
+                        lambda stats, **kwargs: analyzer.summaries.append((stats, kwargs)))
+    return analyzer
+
+
+def test_small_batches_wait_for_the_window(monitor, monkeypatch):
+    monitor._last_summary_time = log_analyzer.time.time()
+    monitor._report_new_data(batch(startup=1, ERROR=2))
+    monitor._report_new_data(batch(ERROR=3))
+    assert monitor.summaries == []
+    
+    # Window has passed: the merged batch goes out once
+    monkeypatch.setattr(log_analyzer, "SUMMARY_WINDOW_SECONDS", 0)
+    monitor._report_new_data(None)
+    [(stats, kwargs)] = monitor.summaries
+    assert len(stats["startup_events"]) == 1
+    assert stats["message_counts"] == Counter({"ERROR": 5})
+    assert kwargs["background"] is True
+    assert kwargs["keep_alive"] == monitor._monitor_keep_alive()
+    assert not monitor._flush_pending()
+
+
+def test_large_batch_is_summarized_at_once(monitor):
+    monitor._last_summary_time = log_analyzer.time.time()
+    monitor._report_new_data(batch(ERROR=log_analyzer.SUMMARY_MAX_PENDING_EVENTS))
+    assert len(monitor.summaries) == 1
+
+
+def test_repeated_pattern_skips_the_llm(monitor, monkeypatch):
+    monkeypatch.setattr(log_analyzer, "SUMMARY_WINDOW_SECONDS", 0)
+    monitor._report_new_data(batch(startup=2, ERROR=4))
+    monitor._report_new_data(batch(startup=2, ERROR=4))
+    assert len(monitor.summaries) == 1
+    monitor._report_new_data(batch(startup=2, ERROR=5))
+    assert len(monitor.summaries) == 2
+
+
+def test_background_summary_does_not_wait_for_a_running_stream(tmp_path, monkeypatch):
+    release = log_analyzer.threading.Event()
+    streamed = []
+    
+    def slow_generate(*, model, prompt, **kwargs):
+        release.wait(5)
+        streamed.append(prompt)
+        return iter([{'response': "summary"}])
+    monkeypatch.setattr(log_analyzer, "_generate", slow_generate)
+    
+    analyzer = make_analyzer(tmp_path, persist_state=False)
+    start = log_analyzer.time.time()
+    analyzer.generate_ai_summary(batch(ERROR=1), background=True)
+    analyzer.generate_ai_summary(batch(ERROR=2), background=True)
+    assert log_analyzer.time.time() - start < 1
+    
+    release.set()
+    analyzer._summary_queue.join()
+    assert len(streamed) == 2
+    assert "{'ERROR': 1}" in streamed[0] and "{'ERROR': 2}" in streamed[1]
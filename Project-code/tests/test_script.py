@@ -0,0 +1,133 @@
+"""
+Tests for the standalone import re.py scanner, checked against a plain substring loop.
+"""
+
+import importlib.util
+import os
+import pickle
+import re
+import sys
+
+import pytest
+
+from log_analyzer_module import helpers
+from test_log_analyzer import FIXTURES, comparable, plain_loop, write_logs
+
+SCRIPT_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "import re.py")
+STARTUP = "started"
+STOP = "shutdown"
+TERMS = ["ERROR", "timeout", "connection timeout", "ERROR", "é"]
+
+SCRIPT_BACKENDS = ["numba", "ahocorasick", "plain"]
+
+
+@pytest.fixture(scope="module")
+def script():
+    # Registered under a name so worker processes can unpickle _scan_file
+    spec = importlib.util.spec_from_file_location("import_re_script", SCRIPT_PATH)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    yield module
+    del sys.modules[spec.name]
+
+
+@pytest.fixture
+def cache_dir(script, tmp_path, monkeypatch):
+    path = tmp_path / "cache"
+    monkeypatch.setattr(script, "CACHE_DIR", str(path))
+    return path
+
+
+@pytest.fixture(params=SCRIPT_BACKENDS)
+def backend(request, script, cache_dir, monkeypatch):
+    """Force one term-counting backend by hiding the faster ones"""
+    order = SCRIPT_BACKENDS[:-1]
+    if request.param != "plain" and getattr(helpers, request.param) is None:
+        pytest.skip(f"{request.param} is not installed")
+    hidden = order if request.param == "plain" else order[:order.index(request.param)]
+    for name in hidden:
+        monkeypatch.setattr(helpers, name, None)
+        monkeypatch.setattr(script, name, None)
+    return request.param
+
+
+@pytest.fixture
+def log_dir(tmp_path):
+    directory = tmp_path / "logs"
+    directory.mkdir()
+    write_logs(directory, FIXTURES)
+    return directory
+
+
+def test_parse_logs_matches_plain_loop(script, backend, log_dir):
+    analyzer = script.LogAnalyzer(str(log_dir), STARTUP, STOP, TERMS)
+    result = analyzer.parse_logs()
+    assert comparable(result) == comparable(plain_loop(log_dir, STARTUP, STOP, TERMS))
+
+
+@pytest.mark.parametrize("startup_msg, search_list", [
+    (STARTUP, [""]),
+    ("", ["ERROR"]),
+    (STARTUP, ["ERROR", ""]),
+])
+def test_empty_needles_visit_every_line(script, backend, log_dir, startup_msg, search_list):
+    # db.log ends without a newline, which used to stall the heap gate
+    analyzer = script.LogAnalyzer(str(log_dir), startup_msg, STOP, search_list)
+    result = analyzer.parse_logs()
+    expected = plain_loop(log_dir, startup_msg, STOP, search_list)
+    assert comparable(result) == comparable(expected)
+
+
+def test_single_file_is_scanned_in_process(script, cache_dir, tmp_path):
+    write_logs(tmp_path, {"app.log": FIXTURES["app.log"]})
+    result = script.LogAnalyzer(str(tmp_path), STARTUP, STOP, TERMS).parse_logs()
+    assert comparable(result) == comparable(plain_loop(tmp_path, STARTUP, STOP, TERMS))
+
+
+@pytest.mark.parametrize("line, expected", [
+    (b"25-12-2024 10:00:00 INFO Service started", "25-12-2024 10:00:00"),
+    (b"[app] 25-12-2024 10:00:00 started", "25-12-2024 10:00:00"),
+    (b"2024-12-25 10:00:00 started", "Unknown Time"),
+    (b"25-12-2024 started", "Unknown Time"),
+    (b"", "Unknown Time"),
+])
+def test_extract_timestamp(script, line, expected):
+    time_pattern = re.compile(rb'(\d{2}-\d{2}-\d{4} \d{2}:\d{2}:\d{2})')
+    assert script._extract_timestamp(line, time_pattern) == expected
+
+
+def test_matchers_are_loaded_from_cache(script, cache_dir, monkeypatch):
+    built = script._load_matchers(TERMS)
+    assert len(os.listdir(cache_dir)) == 1
+    
+    def no_rebuild(search_list):
+        raise AssertionError("matchers rebuilt despite a cache file")
+    monkeypatch.setattr(script, "build_table", no_rebuild)
+    monkeypatch.setattr(script, "build_automaton", no_rebuild)
+    loaded = script._load_matchers(TERMS)
+    assert (loaded[0] is None) == (built[0] is None)
+    assert (loaded[1] is None) == (built[1] is None)
+
+
+@pytest.mark.parametrize("content", [
+    b"",
+    b"not a pickle",
+    pickle.dumps(5),
+    pickle.dumps((1, 2, 3)),
+])
+def test_unusable_cache_file_is_rebuilt(script, cache_dir, content):
+    script._load_matchers(TERMS)
+    [name] = os.listdir(cache_dir)
+    (cache_dir / name).write_bytes(content)
+    table, automaton = script._load_matchers(TERMS)
+    assert (table, automaton) != (1, 2)
+    with open(cache_dir / name, 'rb') as cached:
+        assert len(pickle.load(cached)) == 2
+
+
+def test_cache_key_depends_on_format_version(script, cache_dir, monkeypatch):
+    script._load_matchers(TERMS)
+    monkeypatch.setattr(script, "MATCHER_CACHE_VERSION", script.MATCHER_CACHE_VERSION + 1)
+    script._load_matchers(TERMS)
+    assert len(os.listdir(cache_dir)) == 2